@@ -0,0 +1,30 @@
+import functools
+
+import boto3
+from botocore.config import Config
+
+# botocore already disables Nagle's algorithm (TCP_NODELAY) on its sockets.
+# Keepalive stops idle pooled connections being dropped between calls.
+BOTO_CONFIG = Config(
+    max_pool_connections=20,
+    retries={"mode": "adaptive", "max_attempts": 5},
+    tcp_keepalive=True,
+    connect_timeout=5,
+)
+
+
+@functools.cache
+def get_session():
+    return boto3.session.Session()
+
+
+@functools.cache
+def get_client(service_name):
+    """
+    Return a boto3 client for `service_name`.
+
+    Clients are shared for the life of the process, so credential and region
+    resolution, service model loading and the connection pool are only set
+    up once per Lambda container rather than once per scraper.
+    """
+    return get_session().client(service_name, config=BOTO_CONFIG)
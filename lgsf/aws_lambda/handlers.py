@@ -1,22 +1,87 @@
 import datetime
-import json
-import random
+import functools
 import sys
+import time
 import traceback
 
-import boto3
+import orjson
 from rich.console import Console
 
+from lgsf.aws_lambda.clients import BOTO_CONFIG, get_session
 from lgsf.conf import settings
 from lgsf.councillors.commands import Command
 from lgsf.path_utils import load_scraper
 
+# Bounds for the traceback stored in a run log when a scraper errors
+MAX_TRACEBACK_FRAMES = 10
+MAX_TRACEBACK_LENGTH = 2048
+
+# SQS's upper limits for DelaySeconds and for entries per send_messages call
+MAX_START_DELAY = 900
+SQS_BATCH_SIZE = 10
+# How many times to try sending a message before giving up on it, and how
+# long to wait before the first retry (doubled for each one after that)
+MAX_SEND_ATTEMPTS = 3
+SEND_RETRY_DELAY = 0.5
+
+
+def format_error(exception):
+    """
+    Format the last few frames of an exception's traceback, truncated to
+    MAX_TRACEBACK_LENGTH characters. The end of the traceback is kept, as
+    that's where the exception message is.
+    """
+    error = "".join(
+        traceback.format_exception(
+            type(exception),
+            exception,
+            exception.__traceback__,
+            limit=-MAX_TRACEBACK_FRAMES,
+        )
+    )
+    return error[-MAX_TRACEBACK_LENGTH:]
+
+
+@functools.cache
+def get_scraper_queue():
+    """
+    Return the scraper SQS queue, created once per Lambda container so that
+    warm invocations reuse the same client and connection pool.
+    """
+    sqs = get_session().resource("sqs", config=BOTO_CONFIG)
+    return sqs.get_queue_by_name(QueueName="ScraperQueue")
+
+
+def send_message_batch(queue, entries):
+    """
+    Send up to SQS_BATCH_SIZE messages to `queue`, retrying any that fail.
+
+    `send_messages` doesn't raise if some of the messages aren't sent, it
+    lists them under "Failed" in the response, so check for them here.
+    """
+    for attempt in range(MAX_SEND_ATTEMPTS):
+        if attempt:
+            # Give SQS a moment, in case it's throttling us
+            time.sleep(SEND_RETRY_DELAY * 2 ** (attempt - 1))
+        response = queue.send_messages(Entries=entries)
+        failed = response.get("Failed")
+        if not failed:
+            return
+        failed_ids = {failure["Id"] for failure in failed}
+        entries = [entry for entry in entries if entry["Id"] in failed_ids]
+        if any(failure["SenderFault"] for failure in failed):
+            # The messages themselves are wrong, so trying again won't help
+            break
+    raise RuntimeError(f"Failed to queue messages: {failed}")
+
 
 def scraper_worker_handler(event, context):
     console = Console(file=sys.stdout, record=True)
-    run_log = settings.RUN_LOGGER(start=datetime.datetime.utcnow())
+    run_log = settings.RUN_LOGGER(
+        start=datetime.datetime.now(datetime.timezone.utc)
+    )
 
-    message = json.loads(event["Records"][0]["body"])
+    message = orjson.loads(event["Records"][0]["body"])
 
     council = message["council"]
     command_name = message["scraper_type"]
@@ -34,7 +99,7 @@ def scraper_worker_handler(event, context):
             console.log(f"Scraper for {council} is disabled")
     except Exception as e:
         scraper.console.log(e)
-        run_log.error = traceback.format_exc()
+        run_log.error = format_error(e)
         # This probably means aws_tidy_up hasn't been called.
         # Let's do that ourselves then
         scraper.aws_tidy_up(run_log)
@@ -43,25 +108,30 @@ def scraper_worker_handler(event, context):
 
 
 def queue_builder_handler(event, context):
-    councillors_command = Command(
-        argv=["", "--all-councils"], stdout=sys.stdout
+    councillors_command = Command.from_options(
+        {"all_councils": True, "exclude_missing": True}
     )
-    councillors_command.options = {
-        "all_councils": True,
-        "exclude_missing": True,
-    }
     councils = councillors_command.councils_to_run
 
-    sqs = boto3.resource("sqs")
+    queue = get_scraper_queue()
 
-    queue = sqs.get_queue_by_name(QueueName="ScraperQueue")
+    # TODO Define the message format somewhere else so
+    #  scraper_worker_handler can share it.
+    message_bodies = [
+        orjson.dumps(
+            {"scraper_type": "councillors", "council": council.council_id}
+        ).decode()
+        for council in councils
+    ]
 
-    for council in councils:
-        message = {
-            "scraper_type": "councillors",
-            "council": council.council_id,
-        }  # TODO Define this somewhere else so scraper_worker_handler can share it.
-        start_jitter = random.randrange(0, 900)
-        queue.send_message(
-            MessageBody=json.dumps(message), DelaySeconds=start_jitter
-        )
+    # Spread the start times evenly over MAX_START_DELAY seconds
+    entries = [
+        {
+            "Id": str(i),
+            "MessageBody": message_body,
+            "DelaySeconds": (i * MAX_START_DELAY) // len(message_bodies),
+        }
+        for i, message_body in enumerate(message_bodies)
+    ]
+    for i in range(0, len(entries), SQS_BATCH_SIZE):
+        send_message_batch(queue, entries[i : i + SQS_BATCH_SIZE])
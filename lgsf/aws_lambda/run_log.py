@@ -1,10 +1,20 @@
 import datetime
-import json
-from dataclasses import asdict, dataclass
+import time
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from typing import Dict
 
-from rich.table import Table
+import orjson
+
+
+def _as_naive_utc(value):
+    """
+    Log books were written with naive UTC datetimes (from `utcnow`), so
+    drop the time zone from aware ones to keep the stored format the same.
+    """
+    if isinstance(value, datetime.datetime) and value.tzinfo:
+        return value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value
 
 
 class RunStatus(Enum):
@@ -12,7 +22,7 @@ class RunStatus(Enum):
     ERROR = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class RunLog:
     """Class for keeping track of a single run of a scraper."""
 
@@ -22,23 +32,43 @@ class RunLog:
     log: str = ""
     error: str = ""
     status_code: int = RunStatus.OK.value
+    # Monotonic clock reading used for timing the run. `start` and `end` are
+    # wall clock values kept for display only.
+    _start_ns: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._start_ns = time.monotonic_ns()
 
     def finish(self):
-        self.end = datetime.datetime.utcnow()
-        self.duration = self.end - self.start
+        self.end = datetime.datetime.now(datetime.timezone.utc)
+        self.duration = datetime.timedelta(
+            microseconds=(time.monotonic_ns() - self._start_ns) // 1000
+        )
         if self.error:
             self.status_code = RunStatus.ERROR.value
 
     @property
     def as_dict(self) -> Dict:
-        return asdict(self)
+        # All fields are flat values, so there's no need for the recursive
+        # copy that `asdict` makes
+        return {
+            f.name: _as_naive_utc(getattr(self, f.name))
+            for f in fields(self)
+            if not f.name.startswith("_")
+        }
 
     @property
     def as_json(self) -> str:
-        return json.dumps(self.as_dict, default=str)
+        # Datetimes are passed through to `str` so the output matches what's
+        # already stored in the log books
+        return orjson.dumps(
+            self.as_dict, default=str, option=orjson.OPT_PASSTHROUGH_DATETIME
+        ).decode()
 
     @property
     def as_rich_table(self):
+        from rich.table import Table
+
         table = Table(title="Run report")
         table.add_column("Key", style="magenta")
         table.add_column("Value", style="green")
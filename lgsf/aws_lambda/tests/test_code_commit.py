@@ -1,2 +1,38 @@
 def test_foo():
     print("foo")
+
+
+def test_stage_files_commits_full_batches():
+    from lgsf.scrapers.base import CodeCommitMixin
+
+    class Scraper(CodeCommitMixin):
+        max_batch_files = 4
+        max_batch_bytes = 10
+
+        def __init__(self):
+            self.put_files = []
+            self._put_bytes = 0
+            self.batches = []
+
+        def process_batch(self):
+            self.batches.append(self.put_files)
+            self.put_files = []
+            self._put_bytes = 0
+
+    scraper = Scraper()
+    for i in range(3):
+        scraper.stage_files(
+            [
+                {"filePath": f"{i}.json", "fileContent": b"12"},
+                {"filePath": f"{i}.html", "fileContent": b"34"},
+            ]
+        )
+    # Over the file limit
+    assert [len(batch) for batch in scraper.batches] == [4]
+    scraper.stage_files([{"filePath": "big.html", "fileContent": b"1234567"}])
+    # Over the size limit
+    assert [len(batch) for batch in scraper.batches] == [4, 2]
+    assert scraper.put_files == [
+        {"filePath": "big.html", "fileContent": b"1234567"}
+    ]
+    assert scraper._put_bytes == 7
@@ -0,0 +1,112 @@
+import json
+
+import pytest
+
+from lgsf.aws_lambda import handlers
+from lgsf.aws_lambda.handlers import (
+    MAX_SEND_ATTEMPTS,
+    MAX_START_DELAY,
+    MAX_TRACEBACK_FRAMES,
+    MAX_TRACEBACK_LENGTH,
+    SEND_RETRY_DELAY,
+    format_error,
+)
+from lgsf.commands.base import Council
+from lgsf.councillors.commands import Command
+
+
+def recurse(depth):
+    if depth == 0:
+        raise ValueError("Not many councillors found (3)")
+    recurse(depth - 1)
+
+
+def test_format_error_keeps_last_frames():
+    try:
+        recurse(50)
+    except ValueError as e:
+        error = format_error(e)
+    assert error.count('File "') <= MAX_TRACEBACK_FRAMES
+    assert "test_format_error_keeps_last_frames" not in error
+    assert error.endswith("ValueError: Not many councillors found (3)\n")
+
+
+def test_format_error_truncates_long_messages():
+    try:
+        raise ValueError("x" * 5000)
+    except ValueError as e:
+        error = format_error(e)
+    assert len(error) == MAX_TRACEBACK_LENGTH
+
+
+class FakeQueue:
+    def __init__(self, failures=None):
+        self.batches = []
+        # Message ID -> how many more times sending it fails
+        self.failures = failures or {}
+
+    def send_messages(self, Entries):
+        self.batches.append(Entries)
+        failed = []
+        for entry in Entries:
+            if self.failures.get(entry["Id"]):
+                self.failures[entry["Id"]] -= 1
+                failed.append(
+                    {
+                        "Id": entry["Id"],
+                        "SenderFault": False,
+                        "Code": "InternalError",
+                    }
+                )
+        return {"Successful": [], "Failed": failed}
+
+
+def test_queue_builder_spreads_delays(monkeypatch):
+    queue = FakeQueue()
+    councils = [Council(f"C{i:02}") for i in range(25)]
+    monkeypatch.setattr(handlers, "get_scraper_queue", lambda: queue)
+    monkeypatch.setattr(Command, "councils_to_run", councils)
+
+    handlers.queue_builder_handler({}, None)
+
+    assert [len(batch) for batch in queue.batches] == [10, 10, 5]
+    entries = [entry for batch in queue.batches for entry in batch]
+    delays = [entry["DelaySeconds"] for entry in entries]
+    assert delays == sorted(delays)
+    assert delays[0] == 0
+    assert delays[-1] < MAX_START_DELAY
+    assert json.loads(entries[3]["MessageBody"]) == {
+        "scraper_type": "councillors",
+        "council": "C03",
+    }
+
+
+def test_queue_builder_retries_failed_messages(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(handlers.time, "sleep", sleeps.append)
+    queue = FakeQueue(failures={"3": 1})
+    councils = [Council(f"C{i:02}") for i in range(5)]
+    monkeypatch.setattr(handlers, "get_scraper_queue", lambda: queue)
+    monkeypatch.setattr(Command, "councils_to_run", councils)
+
+    handlers.queue_builder_handler({}, None)
+
+    assert [[entry["Id"] for entry in batch] for batch in queue.batches] == [
+        ["0", "1", "2", "3", "4"],
+        ["3"],
+    ]
+    assert sleeps == [SEND_RETRY_DELAY]
+
+
+def test_queue_builder_raises_when_messages_keep_failing(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(handlers.time, "sleep", sleeps.append)
+    queue = FakeQueue(failures={"3": MAX_SEND_ATTEMPTS})
+    councils = [Council(f"C{i:02}") for i in range(5)]
+    monkeypatch.setattr(handlers, "get_scraper_queue", lambda: queue)
+    monkeypatch.setattr(Command, "councils_to_run", councils)
+
+    with pytest.raises(RuntimeError, match="InternalError"):
+        handlers.queue_builder_handler({}, None)
+    assert len(queue.batches) == MAX_SEND_ATTEMPTS
+    assert sleeps == [SEND_RETRY_DELAY, SEND_RETRY_DELAY * 2]
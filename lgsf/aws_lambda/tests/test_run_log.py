@@ -0,0 +1,46 @@
+import datetime
+import json
+
+from lgsf.aws_lambda.run_log import RunLog, RunStatus
+
+
+def test_finish_sets_duration():
+    run_log = RunLog(start=datetime.datetime.now(datetime.timezone.utc))
+    run_log.finish()
+    assert isinstance(run_log.duration, datetime.timedelta)
+    assert run_log.duration >= datetime.timedelta(0)
+    assert run_log.end >= run_log.start
+    assert run_log.status_code == RunStatus.OK.value
+
+
+def test_finish_with_error():
+    run_log = RunLog(start=datetime.datetime.now(datetime.timezone.utc))
+    run_log.error = "Traceback..."
+    run_log.finish()
+    assert run_log.status_code == RunStatus.ERROR.value
+
+
+def test_as_dict_hides_private_fields():
+    run_log = RunLog()
+    assert list(run_log.as_dict.keys()) == [
+        "start",
+        "end",
+        "duration",
+        "log",
+        "error",
+        "status_code",
+    ]
+
+
+def test_as_json():
+    start = datetime.datetime(2024, 5, 2, 9, 30, tzinfo=datetime.timezone.utc)
+    run_log = RunLog(start=start, log="Scraped 40 councillors")
+    run_log.duration = datetime.timedelta(seconds=12)
+    assert json.loads(run_log.as_json) == {
+        "start": "2024-05-02 09:30:00",
+        "end": 0,
+        "duration": "0:00:12",
+        "log": "Scraped 40 councillors",
+        "error": "",
+        "status_code": 0,
+    }
@@ -1,21 +1,27 @@
 import abc
 import argparse
+import contextlib
 import datetime
-import json
 import os
+import pickle
+import sys
+import tempfile
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from functools import cached_property
+from typing import ClassVar, Dict, List, Optional, Set
 
-import requests
-from dateutil.parser import parse
-from dateutil.utils import today
+import orjson
 from rich.console import Console
-from rich.progress import BarColumn, Progress, TimeElapsedColumn
-from rich.table import Table
 
 from lgsf.conf import settings
-from lgsf.path_utils import _abs_path, load_council_info, load_scraper
+from lgsf.path_utils import (
+    _abs_path,
+    load_council_info,
+    load_scraper,
+    scraper_abs_path,
+)
 
 
 class CommandBase(metaclass=abc.ABCMeta):
@@ -23,11 +29,26 @@ class CommandBase(metaclass=abc.ABCMeta):
 
     def __init__(self, argv, stdout, pretty=False):
         self.argv = argv
-        self.create_parser()
+        # Parsed once here and reused by `execute`
+        self._parsed_args = None
+        if argv is not None:
+            self._parsed_args = self.create_parser()
         self.stdout = stdout
         self.console = Console(file=self.stdout, record=True)
         self.pretty = pretty
 
+    @classmethod
+    def from_options(cls, options, stdout=None):
+        """
+        Build a command from an options dict, skipping argv parsing.
+
+        Useful when the command is driven from code (e.g. a Lambda handler)
+        rather than the command line.
+        """
+        command = cls(argv=None, stdout=stdout or sys.stdout)
+        command.options = options
+        return command
+
     def create_parser(self):
         self.parser = argparse.ArgumentParser()
         if hasattr(self, "add_arguments"):
@@ -49,9 +70,10 @@ class CommandBase(metaclass=abc.ABCMeta):
         )
 
     def execute(self):
-        self.options = vars(self.create_parser())
-        if "unpretty" in self.options:
-            self.pretty = self.options["unpretty"]
+        if self._parsed_args is None:
+            self._parsed_args = self.create_parser()
+        self.options = vars(self._parsed_args)
+        self.pretty = self.options.get("unpretty", self.pretty)
         return self.handle(self.options)
 
     @abc.abstractmethod
@@ -65,92 +87,301 @@ class CommandBase(metaclass=abc.ABCMeta):
         )
 
 
-@dataclass(unsafe_hash=True)
+METADATA_CACHE_FILE_NAME = "metadata.pickle"
+METADATA_READ_WORKERS = 16
+
+
+def _parse_date(date_str):
+    """
+    Parse a date from council metadata. These are ISO 8601 dates, so the
+    (much slower) dateutil parser is only used if that fails.
+    """
+    try:
+        return datetime.date.fromisoformat(date_str[:10])
+    except ValueError:
+        from dateutil.parser import parse
+
+        return parse(date_str).date()
+
+
+def _read_metadata(metadata_path):
+    with open(metadata_path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def _metadata_cache_path():
+    return os.path.join(settings.CACHE_DIR_NAME, METADATA_CACHE_FILE_NAME)
+
+
+def _read_metadata_cache(fingerprint):
+    """
+    Return the cached metadata, or None if there's no cache or it was made
+    from different metadata files to `fingerprint`.
+    """
+    try:
+        with open(_metadata_cache_path(), "rb") as f:
+            cache = pickle.load(f)
+        if cache["fingerprint"] != fingerprint:
+            return None
+        return cache["metadata"]
+    except Exception:
+        # Whatever's wrong with the cache, the metadata files can be read
+        # instead
+        return None
+
+
+def _write_metadata_cache(fingerprint, all_metadata):
+    cache = {"fingerprint": fingerprint, "metadata": all_metadata}
+    # Write to a temporary file and move it in to place, so a half written
+    # cache is never read. The cache directory might not be writable (e.g.
+    # on Lambda), in which case we just go without a cache.
+    with contextlib.suppress(OSError):
+        os.makedirs(settings.CACHE_DIR_NAME, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=settings.CACHE_DIR_NAME)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, _metadata_cache_path())
+        finally:
+            # Only still there if writing or moving it failed
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(temp_path)
+
+
+@dataclass(unsafe_hash=True, slots=True)
 class Council:
+    # Metadata for every council in the scrapers directory, keyed by council
+    # ID. Populated in a single pass by `preload_all`.
+    _all_metadata: ClassVar[Dict[str, dict]] = {}
+    # Just the (start_date, end_date) of each council, parsed, so that
+    # `current` doesn't have to go through the full metadata
+    _date_index: ClassVar[Dict[str, tuple]] = {}
+    # The path of each council's directory, as `_abs_path` would
+    # find it, so that it doesn't have to search the scrapers directory again
+    _dirs: ClassVar[Dict[str, str]] = {}
+    # Lookups that give the same results as `_abs_path` for resolving the
+    # codes passed to `--council`. `_abs_path` first accepts any upper case
+    # council code as is. Failing that, it goes through the directories in
+    # order and takes the first where the code matches the council code
+    # (ignoring case), or any word in the directory name.
+    _upper_codes: ClassVar[Set[str]] = set()
+    # Lower cased code or word -> the council code to use, or None to use the
+    # code as given
+    _code_names: ClassVar[Dict[str, Optional[str]]] = {}
+    # The date councils are checked against in `current`. Set once per
+    # command by `refresh_today`.
+    _today: ClassVar[Optional[datetime.date]] = None
+
     _metadata_cache: dict = field(
         default_factory=dict, init=False, repr=False, hash=False
     )
     council_id: str
 
+    def __post_init__(self):
+        # Council IDs are short and heavily reused as set members and dict
+        # keys, so share one copy of each
+        self.council_id = sys.intern(self.council_id)
+
+    @classmethod
+    def preload_all(cls, scraper_dir=None) -> List[str]:
+        """
+        Read the metadata for every council in `scraper_dir` (defaults to
+        `settings.SCRAPER_DIR_NAME`) in one pass over the directory.
+
+        If `settings.METADATA_CACHE_ENABLED` is set, the parsed metadata is
+        kept in a pickle in `settings.CACHE_DIR_NAME` and reused for as long
+        as none of the metadata files change.
+
+        Returns the council IDs found, in directory order.
+        """
+        scraper_dir = scraper_dir or settings.SCRAPER_DIR_NAME
+        council_ids = []
+        metadata_paths = {}
+        fingerprint = []
+        # `scandir` entries know whether they're a directory (unless they're a
+        # symlink) without the extra `stat` call that `os.path.isdir` makes
+        with os.scandir(scraper_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith("__") or not entry.is_dir():
+                    continue
+                council_id = entry.name.split("-")[0]
+                council_ids.append(council_id)
+                # Match `_abs_path`, which uses the first directory found. It
+                # only looks for an exact directory for upper case codes, so
+                # leave anything else to it.
+                if council_id.isupper():
+                    cls._dirs.setdefault(council_id, entry.path)
+                    cls._upper_codes.add(council_id)
+                    cls._code_names.setdefault(council_id.lower(), None)
+                for part in entry.name.lower().split("-"):
+                    cls._code_names.setdefault(part, council_id.lower())
+                metadata_path = os.path.join(entry.path, "metadata.json")
+                try:
+                    mtime = os.stat(metadata_path).st_mtime_ns
+                except FileNotFoundError:
+                    continue
+                metadata_paths.setdefault(council_id, metadata_path)
+                fingerprint.append((entry.name, mtime))
+        fingerprint = tuple(sorted(fingerprint))
+
+        all_metadata = None
+        if settings.METADATA_CACHE_ENABLED:
+            all_metadata = _read_metadata_cache(fingerprint)
+        if all_metadata is None:
+            # Reading the files is mostly waiting on the filesystem, so overlap
+            # the reads
+            with ThreadPoolExecutor(METADATA_READ_WORKERS) as executor:
+                all_metadata = dict(
+                    zip(
+                        metadata_paths,
+                        executor.map(_read_metadata, metadata_paths.values()),
+                    )
+                )
+            if settings.METADATA_CACHE_ENABLED:
+                _write_metadata_cache(fingerprint, all_metadata)
+
+        for council_id, metadata in all_metadata.items():
+            cls._all_metadata.setdefault(council_id, metadata)
+            if council_id not in cls._date_index:
+                cls._date_index[council_id] = cls._parse_dates(metadata)
+        return council_ids
+
+    @staticmethod
+    def _parse_dates(metadata):
+        end_date = metadata["end_date"]
+        return (
+            _parse_date(metadata["start_date"]),
+            _parse_date(end_date) if end_date else None,
+        )
+
+    @classmethod
+    def refresh_today(cls):
+        cls._today = datetime.date.today()
+
+    def _load_metadata(self):
+        council_dir = self._dirs.get(self.council_id) or scraper_abs_path(
+            self.council_id
+        )
+        metadata_path = os.path.join(council_dir, "metadata.json")
+        return _read_metadata(metadata_path)
+
     @property
     def metadata(self):
         if not self._metadata_cache:
-            metadata_path = os.path.join(
-                _abs_path(settings.SCRAPER_DIR_NAME, self.council_id)[0],
-                "metadata.json",
+            self._metadata_cache = (
+                self._all_metadata.get(self.council_id) or self._load_metadata()
             )
-            with open(metadata_path) as f:
-                self._metadata_cache = json.load(f)
         return self._metadata_cache
 
     @property
     def current(self):
-        if (
-            self.metadata["end_date"]
-            and parse(self.metadata["end_date"]) < today()
-        ):
+        dates = self._date_index.get(self.council_id)
+        if dates is None:
+            dates = self._parse_dates(self.metadata)
+        start_date, end_date = dates
+        today = self._today or datetime.date.today()
+        if end_date and end_date < today:
             # This council has a known end data, and that date is in the past
             return False
-        if parse(self.metadata["start_date"]) > today():
+        if start_date > today:
             return False
         return True
 
 
+def positive_int(value):
+    """
+    An argparse `type` for options that must be a whole number, 1 or more.
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {value}")
+    return number
+
+
 class PerCouncilCommandBase(CommandBase):
     """
     For commands that operate on a list of councils
     """
 
+    def __init__(self, argv, stdout, pretty=False):
+        super().__init__(argv, stdout, pretty=pretty)
+        Council.refresh_today()
+
+    # (args, kwargs) for each `add_argument` call common to all per council
+    # commands
+    council_arguments = (
+        (
+            ("--council",),
+            {
+                "action": "store",
+                "help": "The 3 letter ID of the council to run this command "
+                "on. Can be comma separated",
+            },
+        ),
+        (
+            ("--all-councils",),
+            {
+                "action": "store_true",
+                "help": "Run this command for all councils",
+            },
+        ),
+        (
+            ("--exclude-missing",),
+            {
+                "action": "store_true",
+                "help": "Don't run councils missing a scraper matching "
+                "command name",
+            },
+        ),
+        (
+            ("-t", "--tags"),
+            {
+                "action": "store",
+                "help": "Only run scrapers with the given tags (comma "
+                "separated)",
+            },
+        ),
+        (
+            ("-r", "--refresh"),
+            {
+                "action": "store_true",
+                "help": "Only run scrapers not run recently",
+            },
+        ),
+        (
+            ("--check-only",),
+            {
+                "action": "store_true",
+                "help": "Just check for updated pages, don't scrape anything",
+            },
+        ),
+        (
+            ("-j", "--jobs"),
+            {
+                "action": "store",
+                "type": positive_int,
+                "default": 1,
+                "help": "The number of councils to run at the same time",
+            },
+        ),
+        (
+            ("--list-missing",),
+            {"action": "store_true", "help": "Print missing councils"},
+        ),
+        (
+            ("--list-disabled",),
+            {"action": "store_true", "help": "Print disabled councils"},
+        ),
+        (
+            ("--list-failing",),
+            {"action": "store_true", "help": "Print failing councils"},
+        ),
+    )
+
     def create_parser(self):
         self.parser = argparse.ArgumentParser()
-        self.parser.add_argument(
-            "--council",
-            action="store",
-            help="The 3 letter ID of the council to run this command on. "
-            "Can be comma separated",
-        )
-        self.parser.add_argument(
-            "--all-councils",
-            action="store_true",
-            help="Run this command for all councils",
-        )
-        self.parser.add_argument(
-            "--exclude-missing",
-            action="store_true",
-            help="Don't run councils missing a scraper matching command name",
-        )
-        self.parser.add_argument(
-            "-t",
-            "--tags",
-            action="store",
-            help="Only run scrapers with the given tags (comma separated)",
-        )
-        self.parser.add_argument(
-            "-r",
-            "--refresh",
-            action="store_true",
-            help="Only run scrapers not run recently",
-        )
-        self.parser.add_argument(
-            "--check-only",
-            action="store_true",
-            help="Just check for updated pages, don't scrape anything",
-        )
-        self.parser.add_argument(
-            "--list-missing",
-            action="store_true",
-            help="Print missing councils",
-        )
-        self.parser.add_argument(
-            "--list-disabled",
-            action="store_true",
-            help="Print disabled councils",
-        )
-        self.parser.add_argument(
-            "--list-failing",
-            action="store_true",
-            help="Print failing councils",
-        )
+        for args, kwargs in self.council_arguments:
+            self.parser.add_argument(*args, **kwargs)
 
         self.add_default_arguments(self.parser)
 
@@ -168,35 +399,49 @@ class PerCouncilCommandBase(CommandBase):
             self.parser.error("Can't use --tags and --council together")
         return args
 
-    @property
+    # The scrapers directory doesn't change while a command is running, so the
+    # council lists below are only worked out once per command
+    @cached_property
     def _all_council_dirs(self):
-        return [
-            d.split("-")[0]
-            for d in os.listdir(settings.SCRAPER_DIR_NAME)
-            if os.path.isdir(os.path.join(settings.SCRAPER_DIR_NAME, d))
-            and not d.startswith("__")
-        ]
+        # Listing the directories reads all the councils' metadata at the same
+        # time, rather than opening each file as it's needed
+        return Council.preload_all()
 
-    @property
+    @cached_property
     def all_councils(self):
         return [Council(council_id) for council_id in self._all_council_dirs]
 
-    def missing(self):
+    @cached_property
+    def _missing_and_disabled(self):
+        """
+        Sort current councils in to those missing a scraper for this command,
+        and those with a disabled scraper, loading each scraper only once.
+        """
         always_excluded = ["GLA", "london"]
         missing_councils = []
+        disabled_councils = []
         for council in self.current_councils:
-            if council.council_id in always_excluded:
-                continue
-            scraper = load_scraper(council.council_id, self.command_name)
+            scraper = self.get_scraper_class(council.council_id)
+            council_info = {
+                "code": council.council_id,
+                "name": council.metadata["official_name"],
+            }
             if not scraper:
-                council_info = {
-                    "code": council.council_id,
-                    "name": council.metadata["official_name"],
-                }
-                missing_councils.append(council_info)
-        return sorted(missing_councils, key=lambda d: d["code"])
+                if council.council_id not in always_excluded:
+                    missing_councils.append(council_info)
+            elif scraper.disabled:
+                disabled_councils.append(council_info)
+        return (
+            sorted(missing_councils, key=lambda d: d["code"]),
+            sorted(disabled_councils, key=lambda d: d["code"]),
+        )
+
+    def missing(self):
+        return self._missing_and_disabled[0]
 
     def output_missing(self):
+        from rich.table import Table
+
         table = Table(title=f"Councils missing '{self.command_name}' scraper")
 
         table.add_column("Code", style="magenta")
@@ -207,26 +452,24 @@ class PerCouncilCommandBase(CommandBase):
         self.console.print(table)
 
     def disabled(self):
-        disabled_councils = []
-        for council in self.current_councils:
-            scraper = load_scraper(council.council_id, self.command_name)
-            if scraper and scraper.disabled:
-                council_info = {
-                    "code": council.council_id,
-                    "name": council.metadata["official_name"],
-                }
-                disabled_councils.append(council_info)
-        return sorted(disabled_councils, key=lambda d: d["code"])
+        return self._missing_and_disabled[1]
+
+    @cached_property
+    def _current(self):
+        current_councils = [c for c in self.all_councils if c.current]
+        return current_councils, {c.council_id for c in current_councils}
 
     @property
     def current_councils(self):
-        return [council for council in self.all_councils if council.current]
+        return self._current[0]
 
-    @cached_property
+    @property
     def current_council_ids(self):
-        return {c.council_id for c in self.current_councils}
+        return self._current[1]
 
     def output_disabled(self):
+        from rich.table import Table
+
         table = Table(
             title=f"Councils with '{self.command_name}' disabled scraper"
         )
@@ -239,12 +482,49 @@ class PerCouncilCommandBase(CommandBase):
         self.console.print(table)
 
     def failing(self):
+        import requests
+
+        # Keep a copy of the last response, and only download it again if
+        # it's changed since then. The server's own ETag and Last-Modified
+        # are sent back, as our clock might not match the server's.
+        cache_path = os.path.join(settings.CACHE_DIR_NAME, "failing.json")
+        validators_path = os.path.join(
+            settings.CACHE_DIR_NAME, "failing.validators.json"
+        )
+        headers = {}
+        if os.path.exists(cache_path) and os.path.exists(validators_path):
+            with open(validators_path, "rb") as f:
+                validators = orjson.loads(f.read())
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
         req = requests.get(
-            "https://democracyclub.github.io/lgsf-dashboard/api/failing.json"
+            "https://democracyclub.github.io/lgsf-dashboard/api/failing.json",
+            headers=headers,
+            timeout=10,
         )
-        return req.json()
+        if req.status_code == 304:
+            with open(cache_path, "rb") as f:
+                return orjson.loads(f.read())
+        req.raise_for_status()
+        os.makedirs(settings.CACHE_DIR_NAME, exist_ok=True)
+        with open(cache_path, "wb") as f:
+            f.write(req.content)
+        with open(validators_path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    {
+                        "etag": req.headers.get("ETag"),
+                        "last_modified": req.headers.get("Last-Modified"),
+                    }
+                )
+            )
+        return orjson.loads(req.content)
 
     def output_failing(self):
+        from rich.table import Table
+
         table = Table(title=f"Councils with '{self.command_name}' failing")
         table.add_column("Code", style="magenta")
         table.add_column("Error", style="red")
@@ -270,26 +550,60 @@ class PerCouncilCommandBase(CommandBase):
             )
         )
 
-    @property
+    @cached_property
     def councils_to_run(self):
-        councils = []
+        # Worked out once per command, after `handle` has normalised the
+        # council codes
         if self.options["all_councils"] or self.options["tags"]:
             councils = self.current_councils
-
         else:
-            for council in self.options["council"].split(","):
-                council = Council(council.strip().split("-")[0].upper())
-                councils.append(council)
+            councils = [
+                Council(council.strip().partition("-")[0].upper())
+                for council in self.options["council"].split(",")
+            ]
         if self.options["exclude_missing"]:
-            missing_councils = {c["code"] for c in self.missing()}
-            councils = list(set(councils) - missing_councils)
+            missing_codes = {c["code"] for c in self.missing()}
+            councils = [
+                c for c in councils if c.council_id not in missing_codes
+            ]
         return councils
 
+    def _run_councils_iter(self, councils):
+        """
+        Run each council in `councils`, running up to `--jobs` of them at a
+        time, and yield each council as it finishes.
+        """
+        jobs = self.options.get("jobs") or 1
+        if jobs == 1:
+            for council in councils:
+                self.run_council(council.council_id)
+                yield council
+            return
+
+        # Scraping is mostly waiting on the network, so threads are enough
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(self.run_council, council.council_id): council
+                for council in councils
+            }
+            try:
+                for future in as_completed(futures):
+                    future.result()
+                    yield futures[future]
+            except BaseException:
+                # Including a KeyboardInterrupt while waiting on the councils.
+                # Don't start any more of them, rather than waiting for all of
+                # them to finish before raising.
+                executor.shutdown(cancel_futures=True)
+                raise
+
     def run_councils(self):
-        for council in self.councils_to_run:
-            self.run_council(council.council_id)
+        for _ in self._run_councils_iter(self.councils_to_run):
+            pass
 
     def run_councils_with_progress(self):
+        from rich.progress import BarColumn, Progress, TimeElapsedColumn
+
         to_run = self.councils_to_run
         with Progress(
             "[progress.description]{task.description}",
@@ -300,14 +614,14 @@ class PerCouncilCommandBase(CommandBase):
             auto_refresh=False,
         ) as progress:
             total = progress.add_task(description="Total", total=len(to_run))
-            while not progress.finished:
-                for council in to_run:
-                    self.run_council(council.council_id)
-                    progress.update(total, advance=1)
-                    progress.refresh()
+            for _ in self._run_councils_iter(to_run):
+                progress.update(total, advance=1)
+                progress.refresh()
 
     def _run_single(self, scraper):
-        run_log = settings.RUN_LOGGER(start=datetime.datetime.utcnow())
+        run_log = settings.RUN_LOGGER(
+            start=datetime.datetime.now(datetime.timezone.utc)
+        )
         try:
             scraper.run(run_log)
         except KeyboardInterrupt:
@@ -318,35 +632,103 @@ class PerCouncilCommandBase(CommandBase):
                 raise
         run_log.finish()
 
-        self.console.print(run_log.as_rich_table)
+        # Reports from councils run at the same time can be interleaved
+        table = run_log.as_rich_table
+        table.title = f"Run report: {scraper.options['council']}"
+        self.console.print(table)
+
+    @cached_property
+    def _required_tags(self):
+        if not self.options["tags"]:
+            return None
+        return frozenset(self.options["tags"].split(","))
+
+    def get_scraper_class(self, council_id):
+        """
+        Load this command's scraper for a council, from the directory found
+        when the councils were listed. `load_scraper` only imports each
+        scraper module once, however many times it's needed.
+        """
+        return load_scraper(
+            council_id,
+            self.command_name,
+            council_dir=Council._dirs.get(council_id),
+        )
+
+    def should_run(self, scraper):
+        """
+        Whether a council's scraper is selected by `--refresh` and `--tags`,
+        and isn't disabled.
+        """
+        if scraper.disabled:
+            return False
+        if self.options["refresh"] and scraper.run_since():
+            return False
+        if self._required_tags:
+            if not self._required_tags.issubset(scraper.get_tags):
+                return False
+        return True
+
+    def check_council(self, scraper):
+        """
+        Report whether a council's page has changed, without scraping it.
+        """
+        council = scraper.options["council"]
+        try:
+            changed = scraper.check_for_updates()
+        except Exception as error:
+            if self.options.get("verbose"):
+                raise
+            self.console.log(f"{council}: check failed ({error!r})")
+            return
+        status = "page has changed" if changed else "no change"
+        self.console.log(f"{council}: {status}")
 
     def run_council(self, council):
-        self.options["council"] = council
-        self.options["council_info"] = load_council_info(council)
-        scraper_cls = load_scraper(council, self.command_name)
+        # Each scraper gets its own copy of the options, as councils can be
+        # run concurrently
+        options = {
+            **self.options,
+            "council": council,
+            # Preloaded when the councils were listed, so there's usually no
+            # need to find the council's directory again
+            "council_info": Council._all_metadata.get(council)
+            or load_council_info(council),
+        }
+        scraper_cls = self.get_scraper_class(council)
         if not scraper_cls:
             return
-        with scraper_cls(self.options, self.console) as scraper:
-            should_run = True
-            if scraper.disabled:
-                should_run = False
-            if should_run and self.options["refresh"] and scraper.run_since():
-                should_run = False
-            if should_run and self.options["tags"]:
-                required_tags = set(self.options["tags"].split(","))
-                scraper_tags = set(scraper.get_tags)
-                if not required_tags.issubset(scraper_tags):
-                    should_run = False
-            if should_run:
+        scraper = scraper_cls(options, self.console)
+        if self.options.get("check_only"):
+            # Not used as a context manager, as that would record a run for
+            # `--refresh`
+            try:
+                if self.should_run(scraper):
+                    self.check_council(scraper)
+            finally:
+                scraper.http_client.close()
+            return
+        with scraper:
+            if self.should_run(scraper):
                 self._run_single(scraper)
 
+    def normalise_code(self, code):
+        # Listing the councils fills in the lookups on `Council`
+        self._all_council_dirs
+        if code in Council._upper_codes:
+            return code
+        if code.lower() in Council._code_names:
+            return Council._code_names[code.lower()] or code
+        # Raises an IOError if there's no such council
+        return _abs_path(settings.SCRAPER_DIR_NAME, code)[1]
+
     def normalise_codes(self):
         new_codes = []
         if self.options.get("council"):
             old_codes = self.options["council"].split(",")
 
             for code in old_codes:
-                new_codes.append(_abs_path(settings.SCRAPER_DIR_NAME, code)[1])
+                new_codes.append(self.normalise_code(code))
         self.options["council"] = ",".join(new_codes)
         return self.options
 
@@ -0,0 +1,117 @@
+import json
+import pickle
+
+import pytest
+
+from lgsf.commands import base
+from lgsf.commands.base import METADATA_CACHE_FILE_NAME, Council
+
+
+@pytest.fixture
+def scraper_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(Council, "_all_metadata", {})
+    monkeypatch.setattr(Council, "_date_index", {})
+    monkeypatch.setattr(Council, "_dirs", {})
+    monkeypatch.setattr(Council, "_upper_codes", set())
+    monkeypatch.setattr(Council, "_code_names", {})
+    scraper_dir = tmp_path / "scrapers"
+    scraper_dir.mkdir()
+    for dir_name, name in (
+        ("ABC-armagh-city", "Armagh City Council"),
+        ("KIR-kirklees", "Kirklees Council"),
+    ):
+        council_dir = scraper_dir / dir_name
+        council_dir.mkdir()
+        (council_dir / "metadata.json").write_text(
+            json.dumps(
+                {
+                    "official_name": name,
+                    "start_date": "1996-04-01",
+                    "end_date": None,
+                }
+            )
+        )
+    (scraper_dir / "__pycache__").mkdir()
+    (scraper_dir / "__init__.py").touch()
+    return scraper_dir
+
+
+def test_preload_all(scraper_dir):
+    council_ids = Council.preload_all(scraper_dir)
+    assert sorted(council_ids) == ["ABC", "KIR"]
+    assert Council("KIR").metadata["official_name"] == "Kirklees Council"
+
+
+def test_preload_all_fills_code_lookups(scraper_dir):
+    Council.preload_all(scraper_dir)
+    assert Council._upper_codes == {"ABC", "KIR"}
+    assert Council._code_names["kirklees"] == "kir"
+    assert Council._code_names["kir"] is None
+
+
+def test_current(scraper_dir):
+    old_council_dir = scraper_dir / "OLD-old-council"
+    old_council_dir.mkdir()
+    (old_council_dir / "metadata.json").write_text(
+        json.dumps(
+            {
+                "official_name": "Old Council",
+                "start_date": "1974-04-01",
+                "end_date": "2019-03-31",
+            }
+        )
+    )
+    Council.preload_all(scraper_dir)
+    assert Council("KIR").current
+    assert not Council("OLD").current
+
+
+def test_preload_all_uses_metadata_cache(scraper_dir, cache_dir, monkeypatch):
+    Council.preload_all(scraper_dir)
+    assert [p.name for p in cache_dir.iterdir()] == [METADATA_CACHE_FILE_NAME]
+
+    # A fresh process reads from the cache, rather than the JSON files
+    monkeypatch.setattr(Council, "_all_metadata", {})
+    monkeypatch.setattr(base, "orjson", None)
+    Council.preload_all(scraper_dir)
+    assert Council("ABC").metadata["official_name"] == "Armagh City Council"
+
+
+def test_metadata_cache_invalidated_by_changes(scraper_dir, monkeypatch):
+    Council.preload_all(scraper_dir)
+    metadata_path = scraper_dir / "KIR-kirklees" / "metadata.json"
+    metadata_path.write_text(
+        json.dumps({"official_name": "Kirklees", "start_date": "1996-04-01"})
+    )
+
+    monkeypatch.setattr(Council, "_all_metadata", {})
+    Council.preload_all(scraper_dir)
+    assert Council("KIR").metadata["official_name"] == "Kirklees"
+
+
+@pytest.mark.parametrize(
+    "cache_content",
+    [b"", b"not a pickle", pickle.dumps(["not", "a", "dict"])],
+)
+def test_bad_metadata_cache_is_ignored(scraper_dir, cache_dir, cache_content):
+    cache_dir.mkdir()
+    (cache_dir / METADATA_CACHE_FILE_NAME).write_bytes(cache_content)
+    Council.preload_all(scraper_dir)
+    assert Council("KIR").metadata["official_name"] == "Kirklees Council"
+
+
+def test_metadata_cache_temp_file_removed_on_error(
+    scraper_dir, cache_dir, monkeypatch
+):
+    def fail_replace(src, dst):
+        raise OSError("Read-only file system")
+
+    monkeypatch.setattr(base.os, "replace", fail_replace)
+    Council.preload_all(scraper_dir)
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_council_id_interned():
+    council_id = "".join(["AB", "C"])
+    assert Council(council_id).council_id is Council("ABC").council_id
+    assert not hasattr(Council("ABC"), "__dict__")
@@ -0,0 +1,294 @@
+import io
+import threading
+import time
+from importlib.machinery import SourceFileLoader
+
+import pytest
+import requests
+
+from lgsf import path_utils
+from lgsf.commands import base
+from lgsf.commands.base import Council
+from lgsf.conf import settings
+from lgsf.councillors.commands import Command
+
+
+def test_from_options_skips_argv():
+    command = Command.from_options(
+        {
+            "council": "abd, KIR-kirklees",
+            "all_councils": False,
+            "tags": None,
+            "exclude_missing": False,
+        },
+        stdout=io.StringIO(),
+    )
+    assert command.argv is None
+    assert command.councils_to_run == [Council("ABD"), Council("KIR")]
+
+
+def test_councils_to_run_exclude_missing(monkeypatch):
+    monkeypatch.setattr(
+        Command,
+        "missing",
+        lambda self: [{"code": "KIR", "name": "Kirklees Council"}],
+    )
+    command = Command.from_options(
+        {
+            "council": "ABD,KIR,ABE",
+            "all_councils": False,
+            "tags": None,
+            "exclude_missing": True,
+        },
+        stdout=io.StringIO(),
+    )
+    assert command.councils_to_run == [Council("ABD"), Council("ABE")]
+
+
+def test_run_councils_with_jobs(monkeypatch):
+    run = []
+    monkeypatch.setattr(
+        Command, "run_council", lambda self, council: run.append(council)
+    )
+    command = Command.from_options(
+        {
+            "council": "ABD,KIR,ABE",
+            "all_councils": False,
+            "tags": None,
+            "exclude_missing": False,
+            "jobs": 3,
+        },
+        stdout=io.StringIO(),
+    )
+    command.run_councils()
+    assert sorted(run) == ["ABD", "ABE", "KIR"]
+
+
+@pytest.mark.parametrize("jobs", ["0", "-2", "two"])
+def test_jobs_must_be_at_least_one(jobs):
+    with pytest.raises(SystemExit):
+        Command(["councillors", "--all-councils", "-j", jobs], io.StringIO())
+
+
+def test_run_councils_with_jobs_stops_on_error(monkeypatch):
+    run = []
+    started = threading.Event()
+
+    def run_council(self, council):
+        run.append(council)
+        if council == "ABD":
+            started.wait()
+            raise ValueError("Scraper failed")
+        started.set()
+        time.sleep(0.1)
+
+    monkeypatch.setattr(Command, "run_council", run_council)
+    command = Command.from_options(
+        {
+            "council": ",".join(["ABD"] + [f"C{i:02}" for i in range(20)]),
+            "all_councils": False,
+            "tags": None,
+            "exclude_missing": False,
+            "jobs": 2,
+        },
+        stdout=io.StringIO(),
+    )
+    with pytest.raises(ValueError):
+        command.run_councils()
+    assert len(run) < 21
+
+
+def test_run_councils_with_jobs_stops_on_interrupt(monkeypatch):
+    run = []
+
+    def run_council(self, council):
+        run.append(council)
+        time.sleep(0.05)
+
+    def interrupted(futures):
+        raise KeyboardInterrupt
+        yield
+
+    monkeypatch.setattr(Command, "run_council", run_council)
+    monkeypatch.setattr(base, "as_completed", interrupted)
+    command = Command.from_options(
+        {
+            "council": ",".join(f"C{i:02}" for i in range(20)),
+            "all_councils": False,
+            "tags": None,
+            "exclude_missing": False,
+            "jobs": 2,
+        },
+        stdout=io.StringIO(),
+    )
+    with pytest.raises(KeyboardInterrupt):
+        command.run_councils()
+    assert len(run) < 20
+
+
+def test_run_report_names_council():
+    class FakeScraper:
+        options = {"council": "ABD"}
+
+        def run(self, run_log):
+            pass
+
+    stdout = io.StringIO()
+    command = Command.from_options({}, stdout=stdout)
+    command._run_single(FakeScraper())
+    assert "Run report: ABD" in stdout.getvalue()
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+def test_failing_uses_cached_copy_when_not_modified(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_DIR_NAME", str(tmp_path))
+    responses = [
+        FakeResponse(
+            200,
+            b'[{"council_id": "ABD"}]',
+            {"ETag": '"abc"', "Last-Modified": "Mon, 05 Oct 2026 10:00:00 GMT"},
+        ),
+        FakeResponse(304),
+    ]
+    requests_made = []
+
+    def fake_get(url, headers, timeout):
+        requests_made.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr(requests, "get", fake_get)
+    command = Command.from_options({}, stdout=io.StringIO())
+
+    assert command.failing() == [{"council_id": "ABD"}]
+    assert command.failing() == [{"council_id": "ABD"}]
+    assert requests_made[0] == {}
+    # The server's validators, not the time the file was saved
+    assert requests_made[1] == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Mon, 05 Oct 2026 10:00:00 GMT",
+    }
+
+
+def test_scrapers_loaded_once_per_council(monkeypatch):
+    loaded = []
+
+    class CountingLoader(SourceFileLoader):
+        def load_module(self, name=None):
+            loaded.append(self.path)
+            return super().load_module(name)
+
+    monkeypatch.setattr(path_utils, "SourceFileLoader", CountingLoader)
+    path_utils._load_scraper_class.cache_clear()
+    command = Command.from_options(
+        {"all_councils": True, "tags": None, "exclude_missing": True},
+        stdout=io.StringIO(),
+    )
+    command.output_status()
+    # As run_council would
+    for council in command.councils_to_run:
+        command.get_scraper_class(council.council_id)
+    assert loaded
+    assert len(loaded) == len(set(loaded))
+
+
+def test_run_councils_with_progress_no_councils(monkeypatch):
+    monkeypatch.setattr(Command, "councils_to_run", [])
+    command = Command.from_options({}, stdout=io.StringIO())
+    # Used to loop forever, as the progress bar never finishes
+    command.run_councils_with_progress()
+
+
+def test_normalise_code_matches_abs_path():
+    command = Command.from_options({}, stdout=io.StringIO())
+    for code in ["ABD", "abd", "kirklees", "and", "london"]:
+        expected = base._abs_path(settings.SCRAPER_DIR_NAME, code)[1]
+        assert command.normalise_code(code) == expected
+
+
+def test_normalise_code_uses_preload_scan(monkeypatch):
+    command = Command.from_options({}, stdout=io.StringIO())
+    command._all_council_dirs
+
+    def no_scandir(path):
+        raise AssertionError("Scanned the scrapers dir again")
+
+    monkeypatch.setattr(base.os, "scandir", no_scandir)
+    assert command.normalise_code("kirklees") == "kir"
+
+
+def test_execute_reuses_parsed_args(monkeypatch):
+    calls = []
+    create_parser = Command.create_parser
+
+    def counting_create_parser(self):
+        calls.append(self)
+        return create_parser(self)
+
+    monkeypatch.setattr(Command, "create_parser", counting_create_parser)
+    monkeypatch.setattr(Command, "handle", lambda self, options: None)
+    command = Command(["councillors", "--list-missing"], io.StringIO())
+    command.execute()
+    assert len(calls) == 1
+    assert command.options["list_missing"]
+
+
+def test_run_council_filters_by_tags(monkeypatch):
+    class FakeScraper:
+        disabled = False
+        get_tags = ["modgov", "html"]
+
+        def __init__(self, options, console):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    ran = []
+    monkeypatch.setattr(
+        base, "load_scraper", lambda code, cmd, council_dir: FakeScraper
+    )
+    monkeypatch.setattr(Command, "_run_single", lambda self, s: ran.append(s))
+    for tags in ["modgov", "modgov,cms"]:
+        command = Command.from_options(
+            {"tags": tags, "refresh": False}, stdout=io.StringIO()
+        )
+        command.run_council("ABD")
+    assert len(ran) == 1
+
+
+def test_check_only_filters_by_tags(monkeypatch):
+    class FakeScraper:
+        disabled = False
+
+        def __init__(self, options, console):
+            self.options = options
+            self.get_tags = ["modgov"] if options["council"] == "ABD" else []
+            self.http_client = requests.Session()
+
+        def check_for_updates(self):
+            checked.append(self.options["council"])
+            return True
+
+    checked = []
+    monkeypatch.setattr(
+        base, "load_scraper", lambda code, cmd, council_dir: FakeScraper
+    )
+    command = Command.from_options(
+        {"tags": "modgov", "refresh": False, "check_only": True},
+        stdout=io.StringIO(),
+    )
+    command.run_council("ABD")
+    command.run_council("KIR")
+    assert checked == ["ABD"]
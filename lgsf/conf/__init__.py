@@ -18,7 +18,10 @@ class BaseSettings(object):
         self.BASE_PATH = os.path.abspath(os.path.join(dir_name, "..", ".."))
         self.SCRAPER_DIR_NAME = "scrapers"
         self.DATA_DIR_NAME = "data"
+        self.CACHE_DIR_NAME = ".cache"
         self.COMMAND_FILE_NAME = "commands"
+        # Keep a pickle of the parsed council metadata in the cache dir
+        self.METADATA_CACHE_ENABLED = True
 
         from lgsf.aws_lambda.run_log import RunLog
 
@@ -0,0 +1,14 @@
+import pytest
+
+from lgsf.conf import settings
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """
+    Keep anything cached by a test (e.g. council metadata) out of the
+    working directory.
+    """
+    cache_dir = tmp_path / ".cache"
+    monkeypatch.setattr(settings, "CACHE_DIR_NAME", str(cache_dir))
+    return cache_dir
@@ -6,7 +6,7 @@ from pathlib import Path
 from slugify import slugify
 
 
-@dataclass
+@dataclass(slots=True)
 class CouncillorBase:
     url: str
     identifier: str
@@ -15,6 +15,12 @@ class CouncillorBase:
     division: str
     email: str = field(init=False, hash=False, compare=False)
     photo_url: str = field(init=False, hash=False, compare=False)
+    standing_down: str = field(init=False, hash=False, compare=False)
+    # slugify is relatively slow, and the file name is needed for both the
+    # raw and JSON files
+    _file_name: str = field(
+        init=False, default=None, repr=False, hash=False, compare=False
+    )
 
     def __repr__(self):
         return "<Councillor: Name: {}>".format(self.name)
@@ -29,11 +35,15 @@ class CouncillorBase:
         )
 
     def as_file_name(self):
-        return "{}-{}".format(slugify(self.identifier), slugify(self.name))
+        if self._file_name is None:
+            self._file_name = "{}-{}".format(
+                slugify(self.identifier), slugify(self.name)
+            )
+        return self._file_name
 
     @classmethod
     def from_file_name(cls, filename: Path):
-        data = json.load(filename.open())
+        data = json.loads(filename.read_bytes())
         email = data.pop("email", None)
         photo_url = data.pop("photo_url", None)
         standing_down = data.pop("standing_down", None)
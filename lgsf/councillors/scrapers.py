@@ -1,8 +1,10 @@
 import abc
 import contextlib
 import json
+import re
 from urllib.parse import urljoin
 
+import lxml.html
 from bs4 import BeautifulSoup, Tag
 from dateutil.parser import parse
 
@@ -11,6 +13,8 @@ from lgsf.councillors import CouncillorBase
 from lgsf.councillors.exceptions import SkipCouncillorException
 from lgsf.scrapers import CodeCommitMixin, ScraperBase
 
+XML_DECLARATION = re.compile(r"^\ufeff?\s*<\?xml[^>]*\?>")
+
 
 class BaseCouncillorScraper(CodeCommitMixin, ScraperBase):
     tags = []
@@ -69,47 +73,47 @@ class BaseCouncillorScraper(CodeCommitMixin, ScraperBase):
 
         self.report()
 
-    def prettify_councillor_str(self, councillor_raw_str):
-        if isinstance(councillor_raw_str, dict):
-            return json.dumps(councillor_raw_str, indent=4)
-        if isinstance(councillor_raw_str, Tag):
-            return councillor_raw_str.prettify()
+    def serialise_councillor_raw(self, councillor_raw):
+        """
+        The raw data a councillor was scraped from, as a string to save.
+        """
+        if isinstance(councillor_raw, dict):
+            return json.dumps(councillor_raw, indent=4)
+        if isinstance(councillor_raw, lxml.html.HtmlElement):
+            return lxml.html.tostring(
+                councillor_raw, encoding="unicode", with_tail=False
+            )
+        if isinstance(councillor_raw, Tag):
+            # The markup as it was on the page. `prettify` re-indents the
+            # whole tree, which is slower and makes the file about 50% bigger.
+            return str(councillor_raw)
         return None
 
     def process_councillor(self, councillor, councillor_raw_str):
-        formatted_councillor_raw_str = self.prettify_councillor_str(
+        formatted_councillor_raw_str = self.serialise_councillor_raw(
             councillor_raw_str
         )
 
         if self.options.get("aws_lambda"):
-            # stage...
+            # Staging commits the current batch first if it's full
             self.stage_councillor(formatted_councillor_raw_str, councillor)
-
-            # Do a batch commit if needed...
-            if len(self.put_files) > 90:
-                self.process_batch()
         else:
             self.save_councillor(formatted_councillor_raw_str, councillor)
 
     def stage_councillor(self, councillor_data_string, councillor):
         self.options["council"]
-        json_file_path = (
-            f"{self.scraper_object_type}/json/{councillor.as_file_name()}.json"
-        )
-        raw_file_path = (
-            f"{self.scraper_object_type}/raw/{councillor.as_file_name()}.html"
-        )
-        self.put_files.extend(
+        file_name = councillor.as_file_name()
+        json_file_path = f"{self.scraper_object_type}/json/{file_name}.json"
+        raw_file_path = f"{self.scraper_object_type}/raw/{file_name}.html"
+        self.stage_files(
             [
                 {
                     "filePath": json_file_path,
-                    "fileContent": bytes(
-                        json.dumps(councillor.as_dict(), indent=4), "utf-8"
-                    ),
+                    "fileContent": councillor.as_json().encode("utf-8"),
                 },
                 {
                     "filePath": raw_file_path,
-                    "fileContent": bytes(councillor_data_string, "utf-8"),
+                    "fileContent": councillor_data_string.encode("utf-8"),
                 },
             ]
         )
@@ -142,10 +146,14 @@ class BaseCouncillorScraper(CodeCommitMixin, ScraperBase):
 
 class HTMLCouncillorScraper(BaseCouncillorScraper):
     class_tags = ["html"]
+    # The parser used by `get_page`. html5lib is much slower than lxml, but
+    # parses pages the way a browser would (e.g. adding missing <tbody>
+    # elements), so some scrapers' selectors need it.
+    html_parser = "lxml"
 
     def get_page(self, url):
         page = self.get(url, extra_headers=self.extra_headers).text
-        return BeautifulSoup(page, "html5lib")
+        return BeautifulSoup(page, self.html_parser)
 
     def get_list_container(self):
         """
@@ -204,7 +212,7 @@ class ModGovCouncillorScraper(BaseCouncillorScraper):
             self.clean_data_dir()
         wards = self.get_councillors()
         for ward in wards:
-            for councillor_xml in ward.find_all("councillor"):
+            for councillor_xml in ward.iter("councillor"):
                 try:
                     councillor = self.get_single_councillor(
                         ward, councillor_xml
@@ -220,18 +228,27 @@ class ModGovCouncillorScraper(BaseCouncillorScraper):
     def format_councillor_api_url(self):
         return "{}/mgWebService.asmx/GetCouncillorsByWard".format(self.base_url)
 
+    def get_check_url(self):
+        return self.format_councillor_api_url()
+
     def get_councillors(self):
         req = self.get(self.format_councillor_api_url(), extra_headers=self.extra_headers)
         req.raise_for_status()
-        soup = BeautifulSoup(req.text, "lxml")
-        return soup.findAll("ward")
+        # lxml's HTML parser rather than its XML one, as it copes with badly
+        # formed responses. Like BeautifulSoup, it lower cases the tag names.
+        # It's given the text decoded using the response's charset, as it
+        # would otherwise guess the encoding of the bytes. lxml doesn't accept
+        # text with an encoding declaration, so that's removed first.
+        text = XML_DECLARATION.sub("", req.text, count=1)
+        root = lxml.html.document_fromstring(text)
+        return list(root.iter("ward"))
 
     def get_single_councillor(self, ward, councillor_xml):
-        identifier = councillor_xml.find("councillorid").text
+        identifier = councillor_xml.find(".//councillorid").text_content()
         url = "{}/mgUserInfo.aspx?UID={}".format(self.base_url, identifier)
-        name = councillor_xml.find("fullusername").text
-        division = ward.find("wardtitle").text
-        party = councillor_xml.find("politicalpartytitle").text
+        name = councillor_xml.find(".//fullusername").text_content()
+        division = ward.find(".//wardtitle").text_content()
+        party = councillor_xml.find(".//politicalpartytitle").text_content()
 
         councillor = self.add_councillor(
             url,
@@ -243,18 +260,22 @@ class ModGovCouncillorScraper(BaseCouncillorScraper):
 
         # Emails
         with contextlib.suppress(AttributeError):
-            councillor.email = councillor_xml.find("email").text
+            councillor.email = councillor_xml.find(".//email").text_content()
 
         # Photos
         with contextlib.suppress(AttributeError):
-            councillor.photo_url = councillor_xml.photobigurl.text
+            councillor.photo_url = councillor_xml.find(
+                ".//photobigurl"
+            ).text_content()
 
         # Standing down
         IGNORED_ENDDATES = ["unspecified"]
 
         try:
             enddate = (
-                councillor_xml.find("termsofoffice").findAll("enddate")[-1].text
+                councillor_xml.find(".//termsofoffice")
+                .findall(".//enddate")[-1]
+                .text_content()
             )
             if enddate not in IGNORED_ENDDATES:
                 # councillor.standing_down = enddate
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import functools
 import glob
-import json
 import os
 import pkgutil
 import re
 from importlib import import_module
 from importlib.machinery import SourceFileLoader
 
+import orjson
+
 from lgsf.conf import settings
 
 
@@ -56,13 +58,33 @@ def scraper_path_exists(path):
     return os.path.exists(path)
 
 
-def load_scraper(code, command):
-    from lgsf.scrapers import ScraperBase
+def load_scraper(code, command, council_dir=None):
+    """
+    Load the scraper class for `command` for a council. Pass the council's
+    directory as `council_dir`, if it's already known, to save looking it up.
 
-    path = os.path.join(scraper_abs_path(code), "{}.py".format(command))
+    Each scraper file is only imported once per process (e.g. across warm
+    Lambda invocations).
+    """
+    council_dir = council_dir or scraper_abs_path(code)
+    path = os.path.abspath(os.path.join(council_dir, "{}.py".format(command)))
     if not os.path.exists(path):
         return False
-    scraper_module = SourceFileLoader("module.name", path).load_module()
+    return _load_scraper_class(path)
+
+
+@functools.cache
+def _load_scraper_class(path):
+    from lgsf.scrapers import ScraperBase
+
+    council_dir, file_name = os.path.split(path)
+    # Every scraper needs its own module name. Loading a file in to an
+    # existing module replaces that module's globals, which the classes
+    # already loaded from it would then use.
+    module_name = "scrapers.{}.{}".format(
+        os.path.basename(council_dir), os.path.splitext(file_name)[0]
+    )
+    scraper_module = SourceFileLoader(module_name, path).load_module()
     scraper_class = scraper_module.Scraper
     if not issubclass(scraper_class, ScraperBase):
         raise ValueError(
@@ -72,11 +94,17 @@ def load_scraper(code, command):
     return scraper_class
 
 
+@functools.cache
 def load_council_info(code):
+    """
+    The parsed metadata.json for a council, or None if it doesn't have one.
+
+    Cached for the life of the process, so treat the dict as read only.
+    """
     path = os.path.join(scraper_abs_path(code), "metadata.json")
     if os.path.exists(path):
-        with open(path) as f:
-            return json.loads(f.read())
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
     return None
 
 
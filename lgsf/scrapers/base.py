@@ -1,23 +1,41 @@
 import abc
 import datetime
+import hashlib
 import json
 import os
 import shutil
+import threading
 import traceback
+from urllib.parse import urlsplit
 
-import boto3
 import httpx
 import requests
-from botocore.exceptions import ClientError
 from dateutil import parser
 
 # import requests_cache
 # requests_cache.install_cache("scraper_cache", expire_after=60 * 60 * 24)
+from lgsf.conf import settings
 from lgsf.path_utils import data_abs_path
 
 from ..aws_lambda.run_log import RunLog
 from .checks import ScraperChecker
 
+# Some councils share a site (e.g. a joint ModernGov install), so when councils
+# are scraped concurrently, limit how many requests each host gets at once
+MAX_REQUESTS_PER_HOST = 1
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+
+
+def _host_semaphore(url):
+    host = urlsplit(url).netloc
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(
+                MAX_REQUESTS_PER_HOST
+            )
+        return _host_semaphores[host]
+
 
 class ScraperBase(metaclass=abc.ABCMeta):
     """
@@ -54,7 +72,10 @@ class ScraperBase(metaclass=abc.ABCMeta):
 
         if extra_headers:
             headers.update(extra_headers)
-        response = self.http_client.get(url, headers=headers, timeout=self.timeout)
+        with _host_semaphore(url):
+            response = self.http_client.get(
+                url, headers=headers, timeout=self.timeout
+            )
         response.raise_for_status()
         return response
 
@@ -62,6 +83,61 @@ class ScraperBase(metaclass=abc.ABCMeta):
         checker = ScraperChecker(self.__class__)
         checker.run_checks()
 
+    def get_check_url(self):
+        """
+        The page `check_for_updates` looks at to see if there's anything new.
+        """
+        return self.base_url
+
+    def check_for_updates(self):
+        """
+        Whether the page at `get_check_url` has changed since the last check.
+
+        Sends a conditional GET if the server gave an ETag or Last-Modified
+        header last time, and otherwise compares a hash of the page.
+        """
+        url = self.get_check_url()
+        file_name = self._page_check_file_name()
+        last_check = {}
+        if os.path.exists(file_name):
+            with open(file_name) as f:
+                last_check = json.load(f)
+
+        headers = {}
+        if last_check.get("url") == url:
+            if last_check.get("etag"):
+                headers["If-None-Match"] = last_check["etag"]
+            if last_check.get("last_modified"):
+                headers["If-Modified-Since"] = last_check["last_modified"]
+        try:
+            response = self.get(
+                url, extra_headers={**self.extra_headers, **headers}
+            )
+        except httpx.HTTPStatusError as error:
+            # httpx treats a 304 as an error, requests doesn't
+            if error.response.status_code != 304:
+                raise
+            response = error.response
+        if response.status_code == 304:
+            return False
+
+        content_hash = hashlib.sha256(response.content).hexdigest()
+        changed = not (
+            last_check.get("url") == url
+            and last_check.get("sha256") == content_hash
+        )
+        with open(file_name, "w") as f:
+            json.dump(
+                {
+                    "url": url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "sha256": content_hash,
+                },
+                f,
+            )
+        return changed
+
     def run_since(self, hours=24):
         now = datetime.datetime.now()
         delta = datetime.timedelta(hours=hours)
@@ -75,6 +151,12 @@ class ScraperBase(metaclass=abc.ABCMeta):
         os.makedirs(dir_name, exist_ok=True)
         return os.path.join(dir_name, name)
 
+    def _page_check_file_name(self):
+        # Kept out of the council's data dir, as that's emptied by every scrape
+        dir_name = os.path.join(settings.CACHE_DIR_NAME, "page-checks")
+        os.makedirs(dir_name, exist_ok=True)
+        return os.path.join(dir_name, "{}.json".format(self.options["council"]))
+
     def _last_run_file_name(self):
         return self._file_name("_last-run")
 
@@ -101,6 +183,8 @@ class ScraperBase(metaclass=abc.ABCMeta):
         return self
 
     def __exit__(self, exc_type, exc_value, tb):
+        # Release the client's pooled connections
+        self.http_client.close()
         if not exc_type:
             self._set_last_run()
         else:
@@ -128,24 +212,33 @@ class ScraperBase(metaclass=abc.ABCMeta):
 
 
 class CodeCommitMixin:
+    # CodeCommit's limits on a single commit
+    max_batch_files = 100
+    max_batch_bytes = 6 * 1024 * 1024
+
     def __init__(self, options, console):
         super().__init__(options, console)
 
         if self.options.get("aws_lambda"):
+            # Imported here so that boto3 is only loaded when running on AWS
+            from ..aws_lambda.clients import get_client
+
             self.repository = self.options["council"]
-            self.codecommit_client = boto3.client("codecommit")
+            self.codecommit_client = get_client("codecommit")
             try:
                 self.codecommit_client.get_repository(
                     repositoryName=self.repository
                 )
-            except ClientError as error:
+            except self.codecommit_client.exceptions.ClientError as error:
                 error_code = error.response["Error"]["Code"]
                 if error_code == "RepositoryDoesNotExistException":
                     self.create_repo()
                 else:
                     raise
             self.put_files = []
-            self.today = datetime.datetime.now().strftime("%Y-%m-%d")
+            # The total size of `put_files`, kept as files are staged
+            self._put_bytes = 0
+            self.today = datetime.date.today().isoformat()
             self._branch_head = ""
             self.batch = 1
             self.log_file_path = f"{self.scraper_object_type}/logbook.json"
@@ -299,6 +392,20 @@ class CodeCommitMixin:
         self.branch_head = commit_info["commitId"]
         return commit_info
 
+    def stage_files(self, put_files):
+        """
+        Add files to the next batch commit, committing the current batch
+        first if adding them would go over CodeCommit's limits.
+        """
+        new_bytes = sum(len(f["fileContent"]) for f in put_files)
+        if self.put_files and (
+            len(self.put_files) + len(put_files) > self.max_batch_files
+            or self._put_bytes + new_bytes > self.max_batch_bytes
+        ):
+            self.process_batch()
+        self.put_files.extend(put_files)
+        self._put_bytes += new_bytes
+
     def process_batch(self):
         self.console.log(
             f"Committing batch {self.batch} consisting of {len(self.put_files)} files"
@@ -308,6 +415,7 @@ class CodeCommitMixin:
         self.branch_head = commit_info["commitId"]
         self.batch += 1
         self.put_files = []
+        self._put_bytes = 0
 
     def attempt_merge(self):
         self.console.log("Attempting to create merge commit...")
@@ -413,7 +521,7 @@ class CodeCommitMixin:
             self.codecommit_client.create_repository(
                 repositoryName=self.repository
             )
-        except ClientError as error:
+        except self.codecommit_client.exceptions.ClientError as error:
             error_code = error.response["Error"]["Code"]
             if error_code == "RepositoryNameExistsException":
                 return
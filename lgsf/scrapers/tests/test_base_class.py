@@ -1,6 +1,20 @@
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import httpx
 import pytest
+from rich.console import Console
+
+from lgsf.aws_lambda.run_log import RunLog
+from lgsf.conf import settings
 
-from lgsf.councillors.scrapers import BaseCouncillorScraper
+from lgsf.councillors.scrapers import (
+    BaseCouncillorScraper,
+    ModGovCouncillorScraper,
+)
 
 
 def test_abc_raises():
@@ -9,3 +23,141 @@ def test_abc_raises():
     assert "Can't instantiate abstract class BaseCouncillorScraper" in str(
         excinfo.value
     )
+
+
+MODGOV_XML = b"""<?xml version="1.0" encoding="utf-8"?>
+<councillorsbyward><wards><ward><wardtitle>Abbey</wardtitle><councillors>
+<councillor><councillorid>12</councillorid><fullusername>Jo Smith</fullusername>
+<photobigurl>https://example.com/12.jpg</photobigurl>
+<politicalpartytitle>Labour</politicalpartytitle>
+<workaddress><email>jo@example.com</email></workaddress>
+<termsofoffice><term><enddate>unspecified</enddate></term>
+<term><enddate>04/05/2027</enddate></term></termsofoffice>
+</councillor></councillors></ward></wards></councillorsbyward>"""
+
+
+def test_modgov_get_single_councillor():
+    scraper = ModGovCouncillorScraper.__new__(ModGovCouncillorScraper)
+    scraper.base_url = "https://example.com"
+    scraper.councillors = set()
+    scraper.get = lambda url, extra_headers: httpx.Response(
+        200, content=MODGOV_XML, request=httpx.Request("GET", url)
+    )
+    [ward] = scraper.get_councillors()
+    [councillor_xml] = ward.iter("councillor")
+    councillor = scraper.get_single_councillor(ward, councillor_xml)
+    assert councillor.identifier == "12"
+    assert councillor.name == "Jo Smith"
+    assert councillor.division == "Abbey"
+    assert councillor.party == "Labour"
+    assert councillor.email == "jo@example.com"
+    assert councillor.photo_url == "https://example.com/12.jpg"
+    assert councillor.standing_down == "2027-05-04T00:00:00"
+    assert scraper.serialise_councillor_raw(councillor_xml).startswith(
+        "<councillor><councillorid>12</councillorid>"
+    )
+
+
+def test_modgov_uses_response_charset():
+    # No XML declaration, so the encoding is only given in the HTTP headers
+    xml = MODGOV_XML.split(b"?>", 1)[1].replace(
+        b"Jo Smith", "Zoë Ní Bhriain".encode()
+    )
+    scraper = ModGovCouncillorScraper.__new__(ModGovCouncillorScraper)
+    scraper.base_url = "https://example.com"
+    scraper.councillors = set()
+    scraper.get = lambda url, extra_headers: httpx.Response(
+        200,
+        content=xml,
+        headers={"Content-Type": "text/xml; charset=utf-8"},
+        request=httpx.Request("GET", url),
+    )
+    [ward] = scraper.get_councillors()
+    [councillor_xml] = ward.iter("councillor")
+    councillor = scraper.get_single_councillor(ward, councillor_xml)
+    assert councillor.name == "Zoë Ní Bhriain"
+
+
+def test_check_for_updates(tmp_path, monkeypatch):
+    responses = []
+    sent_headers = []
+
+    def fake_get(url, extra_headers=None):
+        sent_headers.append(extra_headers)
+        response = responses.pop(0)
+        response.request = httpx.Request("GET", url)
+        if response.status_code == 304:
+            raise httpx.HTTPStatusError(
+                "Not Modified", request=response.request, response=response
+            )
+        return response
+
+    monkeypatch.setattr(settings, "CACHE_DIR_NAME", str(tmp_path))
+    scraper = ModGovCouncillorScraper.__new__(ModGovCouncillorScraper)
+    scraper.options = {"council": "ABC"}
+    scraper.base_url = "https://example.com"
+    scraper.extra_headers = {}
+    scraper.get = fake_get
+
+    responses.append(httpx.Response(200, content=b"a", headers={"ETag": "1"}))
+    assert scraper.check_for_updates()
+    responses.append(httpx.Response(304))
+    assert not scraper.check_for_updates()
+    assert sent_headers[-1] == {"If-None-Match": "1"}
+
+    # Without validators, the content is compared
+    responses.append(httpx.Response(200, content=b"b"))
+    assert scraper.check_for_updates()
+    responses.append(httpx.Response(200, content=b"b"))
+    assert not scraper.check_for_updates()
+    assert sent_headers[-1] == {}
+
+
+def test_check_for_updates_after_scrape(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_DIR_NAME", str(tmp_path / "cache"))
+    monkeypatch.setattr(settings, "DATA_DIR_NAME", str(tmp_path / "data"))
+
+    class Scraper(ModGovCouncillorScraper):
+        base_url = "https://example.com"
+
+        def get(self, url, extra_headers=None):
+            return httpx.Response(
+                200,
+                content=MODGOV_XML,
+                headers={"ETag": "1"},
+                request=httpx.Request("GET", url),
+            )
+
+    # Left by an earlier scrape
+    (tmp_path / "data" / "ABC").mkdir(parents=True)
+    options = {"council": "ABC"}
+    scraper = Scraper(options, Console(file=io.StringIO()))
+    assert scraper.check_for_updates()
+    with Scraper(options, Console(file=io.StringIO())) as scraper:
+        scraper.run(RunLog())
+    assert (tmp_path / "data" / "ABC" / "json").exists()
+    # The scrape empties the data dir, but not the last check
+    assert not scraper.check_for_updates()
+
+
+def test_get_limits_concurrent_requests_per_host():
+    active = []
+    most_active = []
+    lock = threading.Lock()
+
+    def fake_http_get(url, headers, timeout):
+        with lock:
+            active.append(url)
+            most_active.append(len(active))
+        time.sleep(0.01)
+        with lock:
+            active.remove(url)
+        return httpx.Response(200, request=httpx.Request("GET", url))
+
+    scraper = ModGovCouncillorScraper.__new__(ModGovCouncillorScraper)
+    scraper.options = {}
+    scraper.http_client = SimpleNamespace(get=fake_http_get)
+    scraper.timeout = 10
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(scraper.get, ["https://shared.example.com/"] * 8))
+    assert max(most_active) == 1
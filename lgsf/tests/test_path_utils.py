@@ -0,0 +1,32 @@
+from lgsf.path_utils import load_scraper
+
+SCRAPER = """
+from lgsf.councillors.scrapers import ModGovCouncillorScraper
+
+COUNCIL_NAME = "{name}"
+
+
+class Scraper(ModGovCouncillorScraper):
+    base_url = "https://example.com"
+
+    def council_name(self):
+        return COUNCIL_NAME
+"""
+
+
+def test_load_scraper_keeps_each_scrapers_globals(tmp_path):
+    for name in ["AAA", "BBB"]:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "councillors.py").write_text(
+            SCRAPER.format(name=name)
+        )
+
+    scraper_a = load_scraper("AAA", "councillors", str(tmp_path / "AAA"))
+    scraper_b = load_scraper("BBB", "councillors", str(tmp_path / "BBB"))
+
+    assert scraper_a.council_name(None) == "AAA"
+    assert scraper_b.council_name(None) == "BBB"
+    assert load_scraper("AAA", "councillors", str(tmp_path / "AAA")) is (
+        scraper_a
+    )
+    assert not load_scraper("AAA", "metadata", str(tmp_path / "AAA"))
@@ -11,6 +11,7 @@ class Scraper(HTMLCouncillorScraper):
         "container_css_selector": ".table-responsive",
         "councillor_css_selector": "tbody tr",
     }
+    html_parser = "html5lib"
 
     def get_single_councillor(self, councillor_html):
         url = urljoin(self.base_url, councillor_html.select_one("a")["href"])
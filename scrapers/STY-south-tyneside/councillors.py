@@ -10,6 +10,7 @@ class Scraper(HTMLCouncillorScraper):
         "container_css_selector": "#COUNCILLORSLISTBYNAME_HTML",  # lol
         "councillor_css_selector": "tbody td a",
     }
+    html_parser = "html5lib"
 
     def get_single_councillor(self, councillor_html):
         url = urljoin(self.base_url, councillor_html["href"])
@@ -1,7 +1,6 @@
 import re
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
 from lgsf.councillors.scrapers import HTMLCouncillorScraper
@@ -16,7 +15,7 @@ class Scraper(HTMLCouncillorScraper):
 
     def get_single_councillor(self, councillor_html):
         url = urljoin(self.base_url, councillor_html.a["href"])
-        req = requests.get(url)
+        req = self.get(url)
         soup = BeautifulSoup(req.text, "lxml")
 
         name = re.sub(